@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC
-from typing import Any, Optional, Set, Tuple, Union
+from typing import Any, Optional, Set, Union
 
 from arango.graph import Graph as ADBGraph
 from rdflib import BNode
@@ -57,7 +57,7 @@ class AbstractArangoRDF(ABC):
         include_adb_v_key_statements: bool,
         include_adb_e_key_statements: bool,
         **adb_export_kwargs: Any,
-    ) -> Tuple[RDFGraph, RDFGraph]:
+    ) -> RDFGraph:
         raise NotImplementedError  # pragma: no cover
 
     def arangodb_collections_to_rdf(
@@ -73,7 +73,7 @@ class AbstractArangoRDF(ABC):
         include_adb_v_key_statements: bool,
         include_adb_e_key_statements: bool,
         **adb_export_kwargs: Any,
-    ) -> Tuple[RDFGraph, RDFGraph]:
+    ) -> RDFGraph:
         raise NotImplementedError  # pragma: no cover
 
     def arangodb_graph_to_rdf(
@@ -87,13 +87,7 @@ class AbstractArangoRDF(ABC):
         include_adb_v_key_statements: bool,
         include_adb_e_key_statements: bool,
         **adb_export_kwargs: Any,
-    ) -> Tuple[RDFGraph, RDFGraph]:
-        raise NotImplementedError  # pragma: no cover
-
-    def __fetch_adb_docs(self) -> None:
-        raise NotImplementedError  # pragma: no cover
-
-    def __insert_adb_docs(self) -> None:
+    ) -> RDFGraph:
         raise NotImplementedError  # pragma: no cover
 
 
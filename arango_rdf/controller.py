@@ -72,22 +72,10 @@ class ArangoRDFController(AbstractArangoRDFController):
         # print(self.db)
         # print(self.rdf_graph)
 
-        best_class = ""
-
         if len(class_set) == 1:
-            best_class = list(class_set)[0]
-
-        elif any([c in subclass_tree for c in class_set]):
-            best_depth = -1
-
-            for c in sorted(class_set):
-                depth = subclass_tree.get_node_depth(c)
-
-                if depth > best_depth:
-                    best_depth = depth
-                    best_class = c
-
-        else:
-            best_class = sorted(class_set)[0]
+            return list(class_set)[0]
 
-        return best_class
+        # The deepest RDFS Class within the subClassOf Taxonomy is the best class.
+        # Ties (including classes missing from the taxonomy, which have a depth
+        # of -1) are resolved alphabetically.
+        return min(class_set, key=lambda c: (-subclass_tree.get_node_depth(c), c))
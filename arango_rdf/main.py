@@ -5,9 +5,11 @@ import os
 import re
 from ast import literal_eval
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, time
 from pathlib import Path
 from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
+from uuid import uuid4
 
 import farmhash
 from arango.cursor import Cursor
@@ -40,6 +42,7 @@ from .utils import (
     Node,
     Tree,
     empty_func,
+    gc_disabled,
     get_bar_progress,
     get_import_spinner_progress,
     get_spinner_progress,
@@ -48,6 +51,29 @@ from .utils import (
 
 PROJECT_DIR = Path(__file__).parent
 
+# Matches the RDF Container Membership Properties (i.e rdf:_1, rdf:_2, ..., rdf:li)
+RDF_CONTAINER_PROPERTY_REGEX = re.compile(
+    r"^http://www.w3.org/1999/02/22-rdf-syntax-ns#(_[0-9]{1,}|li)$"
+)
+
+# Maps the `_rdftype` of an ArangoDB Document to the attribute storing its RDF value
+ADB_RDFTYPE_VALUE_KEY_MAP = {
+    "URIRef": "_uri",
+    "Literal": "_value",
+    "BNode": "_key",
+}
+
+# Resolved once, as rdflib Namespace attribute lookups are not free
+XSD_DECIMAL = XSD.decimal
+
+# Commonly used RDF Collection & RDF Container predicates
+RDF_COLLECTION_PROPERTIES = frozenset({RDF.first, RDF.rest})
+RDF_CONTAINER_FIRST_MEMBER = URIRef(f"{RDF}_1")
+RDF_CONTAINER_LI = URIRef(f"{RDF}li")
+
+# The number of RDF statements processed between progress bar updates
+PROGRESS_BAR_STRIDE = 1000
+
 
 class ArangoRDF(AbstractArangoRDF):
     """ArangoRDF: Transform RDF Graphs into
@@ -88,6 +114,15 @@ class ArangoRDF(AbstractArangoRDF):
         # to store the to-be-inserted ArangoDB documents (RDF-to-ArangoDB).
         self.__adb_docs: ADBDocs
 
+        # An RDF to ArangoDB (RPT) variable used to keep track of the
+        # URIRef & BNode documents that have already been buffered
+        # throughout the transformation, including previously inserted batches.
+        self.__rpt_buffered_keys: DefaultDict[str, Set[str]]
+
+        # An RDF to ArangoDB variable used to keep track of the ArangoDB
+        # Collections known to exist throughout the transformation.
+        self.__adb_cols: Set[str]
+
         # Work-in-progress feature to enhance the Terminology Box of an RDF Graph
         # when importing to ArangoDB.
         self.__contextualize_graph = False
@@ -111,6 +146,18 @@ class ArangoRDF(AbstractArangoRDF):
         self.__adb_key_statements = RDFGraph()
         self.__adb_ns = "http://www.arangodb.com/"
 
+        # A dictionary equivalent of **self.__adb_col_statements**, used to
+        # look up the ArangoDB Collection of an RDF Resource during PGT.
+        self.__adb_col_map: Dict[RDFTerm, str] = {}
+
+        # A cache of previously computed ArangoDB Keys, used to avoid
+        # re-hashing (and re-querying adb:key statements for) the same RDF Term.
+        # Reset whenever **self.__adb_key_statements** is re-assigned.
+        self.__adb_key_cache: Dict[Tuple[str, Optional[RDFTerm]], str] = {}
+
+        # A cache of previously computed ArangoDB Labels (i.e URI suffixes).
+        self.__adb_label_cache: Dict[str, str] = {}
+
         # An RDF Conjunctive Graph representing the
         # Ontology files found under the `arango_rdf/meta/` directory.
         # Essential for fully contextualizing an RDF Graph in ArangoDB.
@@ -600,9 +647,13 @@ class ArangoRDF(AbstractArangoRDF):
 
         self.__rdf_graph = rdf_graph
         self.__adb_key_statements = self.extract_adb_key_statements(rdf_graph)
+        self.__adb_key_cache = {}
+        self.__adb_label_cache = {}
 
         # Reset the ArangoDB Config
         self.__adb_docs = defaultdict(lambda: defaultdict(dict))
+        self.__adb_cols = set()
+        self.__rpt_buffered_keys = defaultdict(set)
         self.__contextualize_graph = contextualize_graph
         self.__use_hashed_literals_as_keys = use_hashed_literals_as_keys
 
@@ -672,17 +723,22 @@ class ArangoRDF(AbstractArangoRDF):
             else self.__rdf_graph.triples
         )
 
-        with Live(Group(bar_progress, spinner_progress)):
+        # Bound methods called for every statement, resolved once
+        bar_progress_advance = bar_progress.advance
+        process_statement = self.__rpt_process_subject_predicate_object
+
+        i = 0
+        with gc_disabled(), Live(Group(bar_progress, spinner_progress)):
             for i, (s, p, o, *sg) in enumerate(statements((None, None, None)), 1):
-                bar_progress.advance(bar_progress_task)
+                if i % PROGRESS_BAR_STRIDE == 0:
+                    bar_progress_advance(bar_progress_task, PROGRESS_BAR_STRIDE)
 
-                self.__rpt_process_subject_predicate_object(
-                    s, p, o, sg, None, contextualize_statement_func
-                )
+                process_statement(s, p, o, sg, None, contextualize_statement_func)
 
                 if i % batch_size == 0:
                     self.__insert_adb_docs(spinner_progress, **adb_import_kwargs)
 
+            bar_progress.update(bar_progress_task, completed=i)
             self.__insert_adb_docs(spinner_progress, **adb_import_kwargs)
 
         return self.__rpt_create_adb_graph(name)
@@ -786,9 +842,12 @@ class ArangoRDF(AbstractArangoRDF):
 
         self.__rdf_graph = rdf_graph
         self.__adb_key_statements = self.extract_adb_key_statements(rdf_graph)
+        self.__adb_key_cache = {}
+        self.__adb_label_cache = {}
 
         # Reset the ArangoDB Config
         self.__adb_docs = defaultdict(lambda: defaultdict(dict))
+        self.__adb_cols = set()
         self.__contextualize_graph = contextualize_graph
 
         # A unique set of instance variables to
@@ -856,6 +915,12 @@ class ArangoRDF(AbstractArangoRDF):
                 self.__rdf_graph, self.__adb_col_statements
             )
 
+        # Querying **self.__adb_col_statements** for every RDF Term is costly,
+        # so the (now final) ArangoDB Collection statements are indexed instead
+        self.__adb_col_map = {}
+        for t, col in self.__adb_col_statements.subject_objects(self.adb_col_uri):
+            self.__adb_col_map.setdefault(t, str(col))
+
         ###########################
         # Flatten Reified Triples #
         ###########################
@@ -899,27 +964,34 @@ class ArangoRDF(AbstractArangoRDF):
             else self.__rdf_graph.triples
         )
 
-        with Live(Group(bar_progress, spinner_progress)):
+        # Bound methods & attributes used for every statement, resolved once
+        bar_progress_advance = bar_progress.advance
+        statement_is_part_of_rdf_list = self.__pgt_statement_is_part_of_rdf_list
+        rdf_list_data = self.__rdf_list_data
+        process_statement = self.__pgt_process_subject_predicate_object
+
+        i = 0
+        with gc_disabled(), Live(Group(bar_progress, spinner_progress)):
             for i, (s, p, o, *sg) in enumerate(statements((None, None, None)), 1):
-                bar_progress.advance(bar_progress_task)
+                if i % PROGRESS_BAR_STRIDE == 0:
+                    bar_progress_advance(bar_progress_task, PROGRESS_BAR_STRIDE)
 
                 # Address the possibility of (s, p, o) being a part of the
                 # structure of an RDF Collection or an RDF Container.
                 # TODO: Move out of loop, into a pre-processing step
-                rdf_list_col = self.__pgt_statement_is_part_of_rdf_list(s, p)
+                rdf_list_col = statement_is_part_of_rdf_list(s, p)
                 if rdf_list_col:
                     key = self.rdf_id_to_adb_label(str(p))
-                    doc = self.__rdf_list_data[rdf_list_col][s]
+                    doc = rdf_list_data[rdf_list_col][s]
                     self.__pgt_rdf_val_to_adb_val(doc, key, o)
                     continue
 
-                self.__pgt_process_subject_predicate_object(
-                    s, p, o, sg, None, contextualize_statement_func
-                )
+                process_statement(s, p, o, sg, None, contextualize_statement_func)
 
                 if i % batch_size == 0:
                     self.__insert_adb_docs(spinner_progress, **adb_import_kwargs)
 
+            bar_progress.update(bar_progress_task, completed=i)
             self.__insert_adb_docs(spinner_progress, **adb_import_kwargs)
 
         ##################
@@ -1037,10 +1109,17 @@ class ArangoRDF(AbstractArangoRDF):
         :return: The ArangoDB _key equivalent of **rdf_id**
         :rtype: str
         """
-        if adb_key := self.__adb_key_statements.value(rdf_term, self.adb_key_uri):
-            return str(adb_key)
+        cache_key = (rdf_id, rdf_term)
+        if (adb_key := self.__adb_key_cache.get(cache_key)) is not None:
+            return adb_key
 
-        return self.hash(rdf_id)
+        if key_val := self.__adb_key_statements.value(rdf_term, self.adb_key_uri):
+            adb_key = str(key_val)
+        else:
+            adb_key = self.hash(rdf_id)
+
+        self.__adb_key_cache[cache_key] = adb_key
+        return adb_key
 
     def hash(self, rdf_id: str) -> str:
         """RDF -> ArangoDB: Hash an RDF Resource ID string into an ArangoDB Key via
@@ -1087,7 +1166,12 @@ class ArangoRDF(AbstractArangoRDF):
         :return: The suffix of the RDF URI string
         :rtype: str
         """
-        return re.split("/|#|:", rdf_id)[-1] or rdf_id
+        if (adb_label := self.__adb_label_cache.get(rdf_id)) is None:
+            i = max(rdf_id.rfind("/"), rdf_id.rfind("#"), rdf_id.rfind(":"))
+            adb_label = rdf_id[i + 1 :] or rdf_id
+            self.__adb_label_cache[rdf_id] = adb_label
+
+        return adb_label
 
     ############################
     # Private: ArangoDB -> RDF #
@@ -1120,10 +1204,12 @@ class ArangoRDF(AbstractArangoRDF):
         :rtype: Tuple[arango.cursor.Cursor, int]
         """
         aql_return_value = "doc"
+        bind_vars: Dict[str, Any] = {"@col": col}
         if explicit_metagraph:
             default_keys = ["_id", "_key"]
             default_keys += ["_from", "_to"] if is_edge else []
-            aql_return_value = f"KEEP(doc, {list(attributes) + default_keys})"
+            aql_return_value = "KEEP(doc, @keep)"
+            bind_vars["keep"] = list(attributes) + default_keys
 
         col_size: int = self.__db.collection(col).count()
 
@@ -1132,7 +1218,7 @@ class ArangoRDF(AbstractArangoRDF):
 
             cursor: Cursor = self.__db.aql.execute(
                 f"FOR doc IN @@col RETURN {aql_return_value}",
-                bind_vars={"@col": col},
+                bind_vars=bind_vars,
                 **{**adb_export_kwargs, **{"stream": True}},
             )
 
@@ -1168,11 +1254,12 @@ class ArangoRDF(AbstractArangoRDF):
 
         with Live(Group(progress)):
             while not cursor.empty():
-                for doc in cursor.batch():
+                batch = cursor.batch()
+                for doc in batch:
                     process_adb_doc(doc, col, col_uri)
-                    progress.advance(progress_task_id)
 
-                cursor.batch().clear()
+                progress.advance(progress_task_id, len(batch))
+                batch.clear()
                 if cursor.has_more():
                     cursor.fetch()
 
@@ -1294,14 +1381,11 @@ class ArangoRDF(AbstractArangoRDF):
         :return: The RDF Term representing the ArangoDB document
         :rtype: URIRef | BNode | Literal
         """
-        key_map = {
-            "URIRef": "_uri",
-            "Literal": "_value",
-            "BNode": "_key",
-        }
-
         rdf_type = doc.get("_rdftype", "URIRef")  # Default to URIRef
-        val = doc.get(key_map[rdf_type], f"{self.__graph_ns}/{col}#{doc['_key']}")
+        if (val_key := ADB_RDFTYPE_VALUE_KEY_MAP[rdf_type]) in doc:
+            val = doc[val_key]
+        else:
+            val = f"{self.__graph_ns}/{col}#{doc['_key']}"
 
         if rdf_type == "URIRef":
             return URIRef(val)
@@ -1375,7 +1459,8 @@ class ArangoRDF(AbstractArangoRDF):
         :return: The RDF Term representing the ArangoDB document
         :rtype: URIRef | BNode | Literal
         """
-        if term := self.__term_map.get(doc_id):
+        # NOTE: Literal terms can be falsy (e.g Literal(0)), hence the None check
+        if (term := self.__term_map.get(doc_id)) is not None:
             return term
 
         # Expensive, but what else can we do?
@@ -1620,53 +1705,66 @@ class ArangoRDF(AbstractArangoRDF):
         """
 
         t_str = str(t)
+        t_type = type(t)
         t_col = ""
-        t_key = self.rdf_id_to_adb_key(t_str, t)
         t_label = ""
 
+        if t_type is Literal and not self.__use_hashed_literals_as_keys:
+            # Every occurrence of the Literal gets its own ArangoDB Document,
+            # so there is no need to hash its value
+            t_key = uuid4().hex
+        else:
+            t_key = self.rdf_id_to_adb_key(t_str, t)
+
         if t in self.__reified_subject_map:
             t_col = self.__STATEMENT_COL
 
             # TODO: Populate adb docs? Or uncessary?
 
-        elif type(t) is URIRef:
+        elif t_type is URIRef:
             t_col = self.__URIREF_COL
             t_label = self.rdf_id_to_adb_label(t_str)
 
-            self.__adb_docs[t_col][t_key] = {
-                "_key": t_key,
-                "_uri": t_str,
-                "_label": t_label,
-                "_rdftype": "URIRef",
-            }
+            # No need to re-build (or re-insert) the document
+            # of an already buffered RDF Resource
+            if t_key not in self.__rpt_buffered_keys[t_col]:
+                self.__rpt_buffered_keys[t_col].add(t_key)
+                self.__adb_docs[t_col][t_key] = {
+                    "_key": t_key,
+                    "_uri": t_str,
+                    "_label": t_label,
+                    "_rdftype": "URIRef",
+                }
 
-        elif type(t) is BNode:
+        elif t_type is BNode:
             t_col = self.__BNODE_COL
 
-            self.__adb_docs[t_col][t_key] = {
-                "_key": t_key,
-                "_label": "",
-                "_rdftype": "BNode",
-            }
+            if t_key not in self.__rpt_buffered_keys[t_col]:
+                self.__rpt_buffered_keys[t_col].add(t_key)
+                self.__adb_docs[t_col][t_key] = {
+                    "_key": t_key,
+                    "_label": "",
+                    "_rdftype": "BNode",
+                }
 
-        elif type(t) is Literal:
+        elif t_type is Literal:
             t_col = self.__LITERAL_COL
-            t_value = self.__get_literal_val(t, t_str)
+            t_value = self.__get_literal_val(t)
             t_label = t_value
 
-            self.__adb_docs[t_col][t_key] = {
+            doc = {
+                "_key": t_key,
                 "_value": t_value,
                 "_label": t_label,  # TODO: REVISIT
                 "_rdftype": "Literal",
             }
 
-            if self.__use_hashed_literals_as_keys:
-                self.__adb_docs[t_col][t_key]["_key"] = t_key
+            if t_lang := t.language:
+                doc["_lang"] = t_lang
+            elif t_datatype := t.datatype:
+                doc["_datatype"] = str(t_datatype)
 
-            if t.language:
-                self.__adb_docs[t_col][t_key]["_lang"] = t.language
-            elif t.datatype:
-                self.__adb_docs[t_col][t_key]["_datatype"] = str(t.datatype)
+            self.__adb_docs[t_col][t_key] = doc
 
         else:
             raise ValueError(f"Unable to process {t}")  # pragma: no cover
@@ -1979,10 +2077,7 @@ class ArangoRDF(AbstractArangoRDF):
             t_col = t_label = p_label
 
         else:
-            t_col = str(
-                self.__adb_col_statements.value(t, self.adb_col_uri)
-                or self.__UNKNOWN_RESOURCE
-            )
+            t_col = self.__adb_col_map.get(t) or self.__UNKNOWN_RESOURCE
 
         return t, t_col, t_key, t_label
 
@@ -2066,6 +2161,7 @@ class ArangoRDF(AbstractArangoRDF):
         """
 
         t, t_col, t_key, t_label = t_meta
+        t_type = type(t)
 
         if t_key in self.__adb_docs.get(t_col, {}):
             return
@@ -2078,7 +2174,7 @@ class ArangoRDF(AbstractArangoRDF):
                 "_to": _to,
             }
 
-        elif type(t) is URIRef:
+        elif t_type is URIRef:
             self.__adb_docs[t_col][t_key] = {
                 "_key": t_key,
                 "_uri": str(t),
@@ -2086,14 +2182,14 @@ class ArangoRDF(AbstractArangoRDF):
                 "_rdftype": "URIRef",
             }
 
-        elif type(t) is BNode:
+        elif t_type is BNode:
             self.__adb_docs[t_col][t_key] = {
                 "_key": t_key,
                 "_label": "",
                 "_rdftype": "BNode",
             }
 
-        elif type(t) is Literal and all([s_col, s_key, p_label]):
+        elif t_type is Literal and s_col and s_key and p_label:
             self.__pgt_process_rdf_literal(
                 t, s_col, s_key, p_label, sg_str, process_val_as_serialized_list
             )
@@ -2133,7 +2229,7 @@ class ArangoRDF(AbstractArangoRDF):
         :type process_val_as_serialized_list: bool
         """
         doc = self.__adb_docs[s_col][s_key]
-        val = self.__get_literal_val(literal, str(literal))
+        val = self.__get_literal_val(literal)
         self.__pgt_rdf_val_to_adb_val(doc, p_label, val, process_val_as_serialized_list)
 
         if sg_str:
@@ -2255,8 +2351,8 @@ class ArangoRDF(AbstractArangoRDF):
         if first in self.__rdf_graph or rest in self.__rdf_graph:
             return True
 
-        _n = (o, URIRef(f"{RDF}_1"), None)
-        li = (o, URIRef(f"{RDF}li"), None)
+        _n = (o, RDF_CONTAINER_FIRST_MEMBER, None)
+        li = (o, RDF_CONTAINER_LI, None)
 
         if _n in self.__rdf_graph or li in self.__rdf_graph:
             return True
@@ -2282,14 +2378,10 @@ class ArangoRDF(AbstractArangoRDF):
         if type(s) is not BNode:
             return ""
 
-        if p in {RDF.first, RDF.rest}:
+        if p in RDF_COLLECTION_PROPERTIES:
             return "_COLLECTION_BNODE"
 
-        p_str = str(p)
-        _n = r"^http://www.w3.org/1999/02/22-rdf-syntax-ns#_[0-9]{1,}$"
-        li = r"^http://www.w3.org/1999/02/22-rdf-syntax-ns#li$"
-
-        if re.match(_n, p_str) or re.match(li, p_str):
+        if RDF_CONTAINER_PROPERTY_REGEX.match(str(p)):
             return "_CONTAINER_BNODE"
 
         return ""
@@ -2724,18 +2816,17 @@ class ArangoRDF(AbstractArangoRDF):
         :type _sg: str
         """
 
-        self.__adb_docs[col][key] = {
-            **self.__adb_docs[col][key],
-            "_key": key,
-            "_from": _from,
-            "_to": _to,
-            "_uri": _uri,
-            "_label": _label,
-            "_rdftype": "URIRef",
-        }
+        # Update the buffered edge in place, as it may already hold properties
+        doc = self.__adb_docs[col][key]
+        doc["_key"] = key
+        doc["_from"] = _from
+        doc["_to"] = _to
+        doc["_uri"] = _uri
+        doc["_label"] = _label
+        doc["_rdftype"] = "URIRef"
 
         if _sg:
-            self.__adb_docs[col][key]["_sub_graph_uri"] = _sg
+            doc["_sub_graph_uri"] = _sg
 
     def __build_explicit_type_map(
         self, adb_adb_col_statement: Callable[..., None] = empty_func
@@ -3032,24 +3123,24 @@ class ArangoRDF(AbstractArangoRDF):
 
         return type_map
 
-    def __get_literal_val(self, t: Literal, t_str: str) -> Any:
+    def __get_literal_val(self, t: Literal) -> Any:
         """RDF -> ArangoDB: Extracts a JSON-serializable representation
         of a Literal's value  based on its datatype.
 
         :param t: The RDF Literal object.
         :type t: Literal
-        :param t_str: The string representation of the RDF Literal
-        :type t_str: str
         :return: A JSON-serializable value representing the Literal
         :rtype: Any
         """
-        if isinstance(t.value, (date, time, Duration)):
-            return t_str
+        t_value = t.value
+
+        if t_value is None or isinstance(t_value, (date, time, Duration)):
+            return str(t)
 
-        if t.datatype == XSD.decimal:
-            return float(t.value)
+        if t.datatype == XSD_DECIMAL:
+            return float(t_value)
 
-        return t.value if t.value is not None else t_str
+        return t_value
 
     def __insert_adb_docs(
         self, spinner_progress: Progress, **adb_import_kwargs: Any
@@ -3072,22 +3163,54 @@ class ArangoRDF(AbstractArangoRDF):
         adb_cols = list(self.__adb_docs.keys())
 
         for col in adb_cols:
-            doc_list = self.__adb_docs[col].values()
-
-            action = f"(RDF → ADB): Import '{col}' ({len(doc_list)})"
-            spinner_progress_task = spinner_progress.add_task("", action=action)
+            if col in self.__adb_cols:
+                continue
 
             if not self.db.has_collection(col):
                 is_edge = col in self.__e_col_map
                 self.db.create_collection(col, edge=is_edge)
 
-            result = self.db.collection(col).import_bulk(doc_list, **adb_import_kwargs)
-            logger.debug(result)
+            self.__adb_cols.add(col)
+
+        # Each collection import is an independent HTTP request,
+        # so they can be issued concurrently. The number of workers is capped
+        # by the default connection pool size of python-arango's HTTP Client.
+        with ThreadPoolExecutor(max_workers=min(len(adb_cols), 10)) as executor:
+            futures = [
+                executor.submit(
+                    self.__import_adb_col, col, spinner_progress, **adb_import_kwargs
+                )
+                for col in adb_cols
+            ]
+
+            for col, future in zip(adb_cols, futures):
+                future.result()
+                del self.__adb_docs[col]
+
+    def __import_adb_col(
+        self, col: str, spinner_progress: Progress, **adb_import_kwargs: Any
+    ) -> None:
+        """RDF -> ArangoDB: Import the buffered ArangoDB documents
+        of a single ArangoDB collection.
+
+        :param col: The ArangoDB collection name.
+        :type col: str
+        :param spinner_progress: The spinner progress bar.
+        :type spinner_progress: rich.progress.Progress
+        :param adb_import_kwargs: Keyword arguments to specify additional
+            parameters for ArangoDB document insertion.
+        :type adb_import_kwargs: Any
+        """
+        doc_list = self.__adb_docs[col].values()
+
+        action = f"(RDF → ADB): Import '{col}' ({len(doc_list)})"
+        spinner_progress_task = spinner_progress.add_task("", action=action)
 
-            del self.__adb_docs[col]
+        result = self.db.collection(col).import_bulk(doc_list, **adb_import_kwargs)
+        logger.debug(result)
 
-            spinner_progress.stop_task(spinner_progress_task)
-            spinner_progress.update(spinner_progress_task, visible=False)
+        spinner_progress.stop_task(spinner_progress_task)
+        spinner_progress.update(spinner_progress_task, visible=False)
 
     def __contextualize_statement(
         self,
@@ -3291,8 +3414,7 @@ class ArangoRDF(AbstractArangoRDF):
         with get_spinner_progress(f"(RDF ↔ ADB): Extract Statements '{str(p)}'") as sp:
             sp.add_task("")
 
-            for t in rdf_graph.triples(triple):
-                extract_graph.add(t)
+            extract_graph.addN((*t, extract_graph) for t in rdf_graph.triples(triple))
 
         if not keep_triples_in_rdf_graph:
             rdf_graph.remove(triple)
@@ -1,6 +1,8 @@
+import gc
 import logging
 import os
-from typing import Any, DefaultDict, Dict, List, Set
+from contextlib import contextmanager
+from typing import Any, DefaultDict, Dict, Iterator, List, Set, Tuple
 
 from rich.progress import (
     BarColumn,
@@ -25,6 +27,19 @@ def empty_func(*args: Any, **kwargs: Any) -> None:
     pass
 
 
+@contextmanager
+def gc_disabled() -> Iterator[None]:
+    # Pauses the cyclic garbage collector, which would otherwise keep re-scanning
+    # the (acyclic) objects allocated in bulk by the RDF -> ArangoDB loops
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
 def get_spinner_progress(text: str) -> Progress:
     return Progress(
         TextColumn(text),
@@ -72,11 +87,28 @@ class Tree:
         self.build_tree(root, root.name)
 
     def build_tree(self, current: Node, parent: str, depth: int = 0) -> None:
-        self.nodes[current.name] = current
-        for sub_val in self.submap[parent]:
-            child_node = Node(sub_val, depth + 1)
-            current.children.append(child_node)
-            self.build_tree(child_node, child_node.name, depth + 1)
+        # Iterative pre-order traversal: a recursive one exceeds Python's
+        # recursion limit on deep or cyclic (e.g rdfs:subClassOf) hierarchies.
+        # Enter & exit markers maintain the names on the current path, so that
+        # a child which is already an ancestor of its parent is skipped.
+        on_path: Set[str] = set()
+        stack: List[Tuple[Node, str, int, bool]] = [(current, parent, depth, True)]
+        while stack:
+            current, parent, depth, is_enter = stack.pop()
+            if not is_enter:
+                on_path.remove(parent)
+                continue
+
+            self.nodes[current.name] = current
+            on_path.add(parent)
+            stack.append((current, parent, depth, False))
+
+            for sub_val in self.submap[parent]:
+                if sub_val not in on_path:
+                    current.children.append(Node(sub_val, depth + 1))
+
+            for child_node in reversed(current.children):
+                stack.append((child_node, child_node.name, depth + 1, True))
 
     def get_node_depth(self, node_id: str) -> int:
         if node_id in self.nodes:
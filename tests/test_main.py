@@ -3,7 +3,7 @@ from typing import Any, Dict, List
 
 import pytest
 from arango_datasets import Datasets
-from rdflib import RDF, RDFS, BNode
+from rdflib import RDF, RDFS, XSD, BNode
 from rdflib import ConjunctiveGraph as RDFConjunctiveGraph
 from rdflib import Graph as RDFGraph
 from rdflib import Literal, URIRef
@@ -4551,6 +4551,52 @@ def test_pgt_container(name: str, rdf_graph: RDFGraph) -> None:
     db.delete_graph(name, drop_collections=True)
 
 
+@pytest.mark.parametrize(
+    "name, rdf_graph",
+    [("Subclass_Cycle_PGT", get_rdf_graph("subclass_cycle.ttl"))],
+)
+def test_pgt_subclass_cycle(name: str, rdf_graph: RDFGraph) -> None:
+    # A mutual rdfs:subClassOf relationship (A <-> B), and a subclass of
+    # rdfs:Class (D), both used to cause infinite recursion in the subclass Tree
+    adb_col_statements_1 = adbrdf.write_adb_col_statements(rdf_graph)
+
+    for c in ["A", "B", "C", "D"]:
+        class_uri = URIRef(f"http://example.com/{c}")
+        assert adb_col_statements_1.value(class_uri, adbrdf.adb_col_uri) == Literal(
+            "Class"
+        )
+
+    alice = URIRef("http://example.com/alice")
+    bob = URIRef("http://example.com/bob")
+    assert adb_col_statements_1.value(alice, adbrdf.adb_col_uri) == Literal("A")
+    assert adb_col_statements_1.value(bob, adbrdf.adb_col_uri) == Literal("D")
+
+    adb_graph = adbrdf.rdf_to_arangodb_by_pgt(
+        name,
+        rdf_graph + RDFGraph(),
+        overwrite_graph=True,
+    )
+
+    assert adb_graph.vertex_collection("A").has(adbrdf.rdf_id_to_adb_key(str(alice)))
+    assert adb_graph.vertex_collection("D").has(adbrdf.rdf_id_to_adb_key(str(bob)))
+    assert adb_graph.edge_collection("subClassOf").count() == 4
+
+    rdf_graph_2 = adbrdf.arangodb_graph_to_rdf(
+        name,
+        type(rdf_graph)(),
+        include_adb_v_col_statements=True,
+    )
+
+    adb_col_statements_2 = adbrdf.extract_adb_col_statements(rdf_graph_2)
+    assert len(subtract_graphs(adb_col_statements_1, adb_col_statements_2)) == 0
+    assert len(subtract_graphs(adb_col_statements_2, adb_col_statements_1)) == 0
+
+    assert len(subtract_graphs(rdf_graph, rdf_graph_2)) == 0
+    assert len(subtract_graphs(rdf_graph_2, rdf_graph)) == 0
+
+    db.delete_graph(name, drop_collections=True)
+
+
 @pytest.mark.parametrize(
     "name",
     [("TestGraph")],
@@ -4707,6 +4753,82 @@ def test_adb_key_uri(name: str, rdf_graph: RDFGraph) -> None:
     db.delete_graph(f"{name}_PGT", drop_collections=True)
 
 
+@pytest.mark.parametrize(
+    "name, rdf_graph",
+    [("Unhashed_Literals_RPT", get_rdf_graph("cases/14_1.ttl"))],
+)
+def test_rpt_unhashed_literal_keys(name: str, rdf_graph: RDFGraph) -> None:
+    NUM_LITERAL_STATEMENTS = len(get_literal_statements(rdf_graph))
+
+    adb_graph = adbrdf.rdf_to_arangodb_by_rpt(
+        name,
+        rdf_graph + RDFGraph(),
+        use_hashed_literals_as_keys=False,
+        overwrite_graph=True,
+    )
+
+    # Each occurrence of an RDF Literal is its own ArangoDB Document
+    LITERAL_COL = adb_graph.vertex_collection(f"{name}_Literal")
+    assert LITERAL_COL.count() == NUM_LITERAL_STATEMENTS
+
+    STATEMENT_COL = adb_graph.edge_collection(f"{name}_Statement")
+    for edge in STATEMENT_COL:
+        if edge["_to"].startswith(f"{name}_Literal/"):
+            assert LITERAL_COL.has(edge["_to"])
+
+    rdf_graph_2 = adbrdf.arangodb_graph_to_rdf(name, type(rdf_graph)())
+
+    assert len(subtract_graphs(rdf_graph, rdf_graph_2)) == 0
+    assert len(subtract_graphs(rdf_graph_2, rdf_graph)) == 0
+
+    db.delete_graph(name, drop_collections=True)
+
+
+@pytest.mark.parametrize(
+    "name, rdf_graph",
+    [("Ill_Typed_Literal_RPT", get_rdf_graph("ill_typed_literal.ttl"))],
+)
+def test_rpt_ill_typed_literal(name: str, rdf_graph: RDFGraph) -> None:
+    adb_graph = adbrdf.rdf_to_arangodb_by_rpt(
+        name,
+        rdf_graph + RDFGraph(),
+        overwrite_graph=True,
+    )
+
+    # An ill-typed Literal keeps its lexical form as its value
+    LITERAL_COL = adb_graph.vertex_collection(f"{name}_Literal")
+    values = {doc["_value"]: doc["_datatype"] for doc in LITERAL_COL}
+    assert values == {"abc": str(XSD.decimal), 0.5: str(XSD.decimal)}
+
+    rdf_graph_2 = adbrdf.arangodb_graph_to_rdf(name, type(rdf_graph)())
+
+    assert len(subtract_graphs(rdf_graph, rdf_graph_2)) == 0
+    assert len(subtract_graphs(rdf_graph_2, rdf_graph)) == 0
+
+    db.delete_graph(name, drop_collections=True)
+
+
+@pytest.mark.parametrize(
+    "name, rdf_graph",
+    [("Ill_Typed_Literal_PGT", get_rdf_graph("ill_typed_literal.ttl"))],
+)
+def test_pgt_ill_typed_literal(name: str, rdf_graph: RDFGraph) -> None:
+    adb_graph = adbrdf.rdf_to_arangodb_by_pgt(
+        name,
+        rdf_graph + RDFGraph(),
+        overwrite_graph=True,
+    )
+
+    _item = adbrdf.rdf_id_to_adb_key("http://example.com/item")
+
+    # An ill-typed Literal keeps its lexical form as its value
+    doc = adb_graph.vertex_collection(f"{name}_UnknownResource").get(_item)
+    assert doc["price"] == "abc"
+    assert doc["discount"] == 0.5
+
+    db.delete_graph(name, drop_collections=True)
+
+
 @pytest.mark.parametrize(
     "name, path, edge_definitions, orphan_collections",
     [